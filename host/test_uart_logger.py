@@ -0,0 +1,73 @@
+import contextlib
+import io
+import os
+import random
+import tempfile
+import unittest
+
+from uart_logger import LogAnalyzer
+
+HEADER = 'timestamp,sensor_id,sequence,temperature,raw_data'
+
+class TestReadLogFile(unittest.TestCase):
+    """Compare the pandas and csv.DictReader paths of LogAnalyzer.read_log_file"""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def _write_log(self, rows):
+        path = os.path.join(self.tmp_dir.name, 'log.csv')
+        with open(path, 'w', newline='') as file:
+            file.write('\n'.join([HEADER] + rows) + '\n')
+        return path
+
+    def _read_both(self, path):
+        with contextlib.redirect_stdout(io.StringIO()):
+            df = LogAnalyzer.read_log_file(path)
+            dicts = LogAnalyzer.read_log_file(path, as_dicts=True)
+        return df, dicts
+
+    def _assert_paths_match(self, path):
+        df, dicts = self._read_both(path)
+        self.assertEqual(df['sequence'].tolist(), [row['sequence'] for row in dicts])
+        self.assertEqual(df['temperature'].tolist(), [row['temperature'] for row in dicts])
+        self.assertEqual(df['sensor_id'].tolist(), [row['sensor_id'] for row in dicts])
+        return df
+
+    def _random_rows(self, count):
+        return [f"2026-01-01T00:00:{i % 60:02d},TEMP01,{i},{random.uniform(-40, 125)!r},raw_{i}"
+                for i in range(count)]
+
+    def test_clean_log(self):
+        df = self._assert_paths_match(self._write_log(self._random_rows(200)))
+        self.assertEqual(len(df), 200)
+
+    def test_extra_field_in_first_row(self):
+        rows = self._random_rows(1000)
+        rows[0] += ',EXTRA'
+        df = self._assert_paths_match(self._write_log(rows))
+        self.assertEqual(len(df), 1000)
+
+    def test_invalid_temperature_keeps_precision(self):
+        rows = self._random_rows(2000)
+        rows[500] = 't,TEMP01,500,oops,r'
+        df = self._assert_paths_match(self._write_log(rows))
+        self.assertEqual(len(df), 1999)
+
+    def test_non_integer_sequences_are_skipped(self):
+        rows = self._random_rows(10)
+        rows[2] = 't,TEMP01,1.5,20.0,r'
+        rows[4] = 't,TEMP01,,20.0,r'
+        rows[6] = 't,TEMP01,abc,20.0,r'
+        df = self._assert_paths_match(self._write_log(rows))
+        self.assertEqual(len(df), 7)
+
+    def test_out_of_range_sequence_is_skipped(self):
+        rows = self._random_rows(5)
+        rows[1] = 't,TEMP01,99999999999999999999,20.0,r'
+        df, _ = self._read_both(self._write_log(rows))
+        self.assertEqual(df['sequence'].tolist(), [0, 2, 3, 4])
+
+if __name__ == "__main__":
+    unittest.main()
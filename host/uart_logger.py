@@ -1,19 +1,39 @@
 import csv
+import mmap
 import os
 from datetime import datetime
 import threading
 import queue
+import time
+from collections import namedtuple
+import numpy as np
+import pandas as pd
+
+# Single log entry; timestamp is time.time_ns() and is formatted when written
+Sample = namedtuple('Sample', 'timestamp sensor_id sequence temperature raw_data')
 
 class DataLogger:
     """Handles CSV logging and data persistence"""
     
+    # Maximum number of queued entries written per batch
+    BATCH_SIZE = 256
+    # Flush buffered rows after this many rows or seconds, whichever comes first
+    FLUSH_ROWS = 512
+    FLUSH_INTERVAL = 2.0
+    # Release the log's page cache once this many new bytes have been written
+    RELEASE_CACHE_BYTES = 1 << 20
+    # Maximum number of entries waiting to be written; the oldest are dropped beyond this
+    MAX_QUEUE_SIZE = 10000
+    
     def __init__(self, log_dir="logs", filename_prefix="temperature_log"):
         self.log_dir = log_dir
         self.filename_prefix = filename_prefix
         self.current_file = None
         self.csv_writer = None
         self.file_handle = None
-        self.data_queue = queue.Queue()
+        self._released_offset = 0  # File offset up to which the page cache has been released
+        self.data_queue = queue.Queue(maxsize=self.MAX_QUEUE_SIZE)
+        self.dropped_count = 0
         self.logging_thread = None
         self.stop_logging = threading.Event()
         
@@ -30,18 +50,58 @@ class DataLogger:
     
     def _logging_worker(self):
         """Background thread worker for writing log data"""
+        rows_since_flush = 0
+        last_flush = time.monotonic()
+        
         while not self.stop_logging.is_set():
             try:
-                # Wait for data with timeout
+                # Wait for data with timeout, then drain whatever else is queued
                 data = self.data_queue.get(timeout=1.0)
-                if data is None:  # Poison pill to stop thread
+                batch = [data]
+                try:
+                    while len(batch) < self.BATCH_SIZE and batch[-1] is not None:
+                        batch.append(self.data_queue.get_nowait())
+                except queue.Empty:
+                    pass
+                
+                stop = batch[-1] is None  # Poison pill to stop thread
+                rows = batch[:-1] if stop else batch
+                if rows:
+                    self._write_batch_to_csv(rows)
+                    rows_since_flush += len(rows)
+                for _ in batch:
+                    self.data_queue.task_done()
+                if stop:
                     break
-                self._write_to_csv(data)
-                self.data_queue.task_done()
             except queue.Empty:
-                continue
+                pass
             except Exception as e:
                 print(f"Logging error: {e}")
+                continue
+            
+            # Periodically push buffered rows to the OS
+            if rows_since_flush and (rows_since_flush >= self.FLUSH_ROWS or
+                                     time.monotonic() - last_flush > self.FLUSH_INTERVAL):
+                try:
+                    self.file_handle.flush()
+                    self._release_page_cache()
+                except Exception as e:
+                    print(f"Logging error: {e}")
+                rows_since_flush = 0
+                last_flush = time.monotonic()
+    
+    def _release_page_cache(self):
+        """Ask the OS to write back and drop cached pages of the log file (where supported)"""
+        # Long-running loggers otherwise keep the whole log in the page cache. Only full pages
+        # written since the last release are covered, so the partly filled last page is left
+        # to the kernel's normal writeback.
+        if not hasattr(os, 'posix_fadvise'):
+            return
+        fd = self.file_handle.fileno()
+        end = os.lseek(fd, 0, os.SEEK_CUR) // mmap.PAGESIZE * mmap.PAGESIZE
+        if end - self._released_offset >= self.RELEASE_CACHE_BYTES:
+            os.posix_fadvise(fd, self._released_offset, end - self._released_offset, os.POSIX_FADV_DONTNEED)
+            self._released_offset = end
     
     def _get_log_filename(self):
         """Generate log filename with timestamp"""
@@ -52,7 +112,8 @@ class DataLogger:
         """Ensure CSV file is open and ready for writing"""
         if self.file_handle is None:
             self.current_file = self._get_log_filename()
-            self.file_handle = open(self.current_file, 'w', newline='')
+            self.file_handle = open(self.current_file, 'w', newline='', buffering=65536)
+            self._released_offset = 0
             self.csv_writer = csv.writer(self.file_handle)
             
             # Write header
@@ -61,43 +122,75 @@ class DataLogger:
             self.file_handle.flush()
             print(f"Created log file: {self.current_file}")
     
-    def _write_to_csv(self, data):
-        """Write data to CSV file"""
-        try:
-            self._ensure_csv_open()
-            
-            # Extract data fields
+    @staticmethod
+    def _escape_field(value):
+        """Format a CSV field the way csv.writer does (None is empty, quoted only when needed)"""
+        value = '' if value is None else str(value)
+        if ',' in value or '"' in value or '\r' in value or '\n' in value:
+            return '"' + value.replace('"', '""') + '"'
+        return value
+    
+    @staticmethod
+    def _format_timestamp(timestamp):
+        """Format a Sample's time.time_ns() timestamp as ISO 8601 (other values are written as-is)"""
+        if isinstance(timestamp, int):
+            seconds, nanoseconds = divmod(timestamp, 1_000_000_000)
+            return datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000).isoformat()
+        return timestamp
+    
+    def _format_row(self, data):
+        """Convert a logged Sample (or data dict) into a CSV line"""
+        if isinstance(data, dict):
+            # Dict timestamps are caller-supplied and written as-is
             timestamp = data.get('timestamp', datetime.now().isoformat())
             sensor_id = data.get('sensor_id', 'N/A')
             sequence = data.get('sequence', 0)
             temperature = data.get('temperature', 0.0)
             raw_data = data.get('raw_data', '')
-            
-            # Write row
-            row = [timestamp, sensor_id, sequence, temperature, raw_data]
-            self.csv_writer.writerow(row)
-            self.file_handle.flush()
-            
+        else:
+            timestamp, sensor_id, sequence, temperature, raw_data = data
+            timestamp = self._format_timestamp(timestamp)
+        
+        escape = self._escape_field
+        return (f"{escape(timestamp)},{escape(sensor_id)},{escape(sequence)},"
+                f"{escape(temperature)},{escape(raw_data)}\r\n")
+    
+    def _write_batch_to_csv(self, batch):
+        """Write a batch of data to CSV file"""
+        # Rows are fixed-schema, so format them directly and write the batch in one call
+        lines = []
+        for data in batch:
+            try:
+                lines.append(self._format_row(data))
+            except Exception as e:
+                print(f"CSV write error: {e}")
+        
+        try:
+            self._ensure_csv_open()
+            self.file_handle.write(''.join(lines))
         except Exception as e:
             print(f"CSV write error: {e}")
     
     def log_data(self, data):
-        """Add data to logging queue (thread-safe)"""
+        """Add data (a Sample or dict) to logging queue (thread-safe)"""
         try:
-            self.data_queue.put(data, block=False)
+            self.data_queue.put_nowait(data)
         except queue.Full:
-            print("Warning: Logging queue full, dropping data")
+            # Drop the oldest entry to keep the log as fresh as possible
+            try:
+                self.data_queue.get_nowait()
+                self.data_queue.task_done()
+                self.dropped_count += 1
+            except queue.Empty:
+                pass
+            try:
+                self.data_queue.put_nowait(data)
+            except queue.Full:
+                self.dropped_count += 1
     
     def log_temperature(self, sensor_id, sequence, temperature, raw_data=""):
         """Convenience method to log temperature data"""
-        data = {
-            'timestamp': datetime.now().isoformat(),
-            'sensor_id': sensor_id,
-            'sequence': sequence,
-            'temperature': temperature,
-            'raw_data': raw_data
-        }
-        self.log_data(data)
+        self.log_data(Sample(time.time_ns(), sensor_id, sequence, temperature, raw_data))
     
     def get_current_file(self):
         """Get current log file path"""
@@ -108,6 +201,7 @@ class DataLogger:
         stats = {
             'current_file': self.current_file,
             'queue_size': self.data_queue.qsize(),
+            'dropped_count': self.dropped_count,
             'logging_active': self.logging_thread.is_alive() if self.logging_thread else False
         }
         
@@ -121,13 +215,21 @@ class DataLogger:
         """Close logger and cleanup resources"""
         # Stop logging thread
         self.stop_logging.set()
-        self.data_queue.put(None)  # Poison pill
+        try:
+            self.data_queue.put_nowait(None)  # Poison pill
+        except queue.Full:
+            pass  # The worker still exits on stop_logging within its get() timeout
         
         if self.logging_thread:
             self.logging_thread.join(timeout=2.0)
         
         # Close file handle
         if self.file_handle:
+            try:
+                self.file_handle.flush()
+                os.fsync(self.file_handle.fileno())
+            except OSError as e:
+                print(f"Error syncing log file: {e}")
             self.file_handle.close()
             self.file_handle = None
             self.csv_writer = None
@@ -140,9 +242,69 @@ class DataLogger:
 class LogAnalyzer:
     """Analyze logged temperature data"""
     
+    LOG_COLUMNS = ['timestamp', 'sensor_id', 'sequence', 'temperature', 'raw_data']
+    
     @staticmethod
-    def read_log_file(filepath):
-        """Read and parse CSV log file"""
+    def read_log_file(filepath, as_dicts=False):
+        """Read and parse CSV log file into a DataFrame (or a list of dicts if as_dicts is set)"""
+        if as_dicts:
+            return LogAnalyzer._read_log_file_dicts(filepath)
+        
+        try:
+            # usecols keeps pandas from turning the first column into an index when a row has extra fields
+            df = pd.read_csv(filepath, usecols=LogAnalyzer.LOG_COLUMNS,
+                             dtype={'timestamp': str, 'sensor_id': str, 'sequence': str, 'raw_data': str},
+                             keep_default_na=False, float_precision='round_trip', on_bad_lines='skip')
+            invalid = np.zeros(len(df), dtype=bool)
+            
+            if not pd.api.types.is_numeric_dtype(df['temperature']):
+                # A malformed value left the column as text; re-parse with float() so valid
+                # rows keep full precision (pd.to_numeric does not round-trip)
+                temperatures = [LogAnalyzer._parse_float(value) for value in df['temperature']]
+                invalid |= np.array([value is None for value in temperatures], dtype=bool)
+                df['temperature'] = np.array([np.nan if value is None else value for value in temperatures],
+                                             dtype=np.float64)
+            
+            try:
+                df['sequence'] = df['sequence'].astype(np.int64)
+            except (ValueError, OverflowError):
+                # Reject non-integer and out-of-range sequences instead of truncating them
+                sequences = [LogAnalyzer._parse_int(value) for value in df['sequence']]
+                invalid |= np.array([value is None for value in sequences], dtype=bool)
+                df['sequence'] = np.array([0 if value is None else value for value in sequences], dtype=np.int64)
+            
+            if invalid.any():
+                print(f"Skipping {int(invalid.sum())} invalid rows")
+                df = df[~invalid]
+            
+            return df
+        except FileNotFoundError:
+            print(f"Log file not found: {filepath}")
+        except Exception as e:
+            print(f"Error reading log file: {e}")
+        
+        return pd.DataFrame()
+    
+    @staticmethod
+    def _parse_float(value):
+        """Parse a float, returning None for invalid values"""
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    
+    @staticmethod
+    def _parse_int(value):
+        """Parse an int64, returning None for invalid or out-of-range values"""
+        try:
+            value = int(value)
+        except ValueError:
+            return None
+        return value if -2 ** 63 <= value < 2 ** 63 else None
+    
+    @staticmethod
+    def _read_log_file_dicts(filepath):
+        """Read and parse CSV log file row by row into dicts"""
         data = []
         try:
             with open(filepath, 'r') as file:
@@ -163,27 +325,24 @@ class LogAnalyzer:
     
     @staticmethod
     def analyze_data(data):
-        """Perform basic statistical analysis on temperature data"""
-        if not data:
+        """Perform basic statistical analysis on temperature data (DataFrame or list of dicts)"""
+        if len(data) == 0:
             return {}
         
-        temperatures = [row['temperature'] for row in data]
+        if isinstance(data, pd.DataFrame):
+            temps = data['temperature'].to_numpy(dtype=np.float64)
+        else:
+            temps = np.fromiter((row['temperature'] for row in data), dtype=np.float64, count=len(data))
         
         analysis = {
-            'count': len(temperatures),
-            'min': min(temperatures),
-            'max': max(temperatures),
-            'average': sum(temperatures) / len(temperatures),
-            'range': max(temperatures) - min(temperatures)
+            'count': int(temps.size),
+            'min': float(temps.min()),
+            'max': float(temps.max()),
+            'average': float(temps.mean()),
+            'range': float(np.ptp(temps)),
+            'std_dev': float(temps.std(ddof=1)) if temps.size > 1 else 0.0
         }
         
-        # Calculate standard deviation
-        if len(temperatures) > 1:
-            variance = sum((t - analysis['average']) ** 2 for t in temperatures) / (len(temperatures) - 1)
-            analysis['std_dev'] = variance ** 0.5
-        else:
-            analysis['std_dev'] = 0.0
-        
         return analysis
     
     @staticmethod
@@ -217,8 +376,8 @@ if __name__ == "__main__":
     stats = logger.get_log_stats()
     print(f"Logger stats: {stats}")
     
-    # Wait for logging to complete
-    time.sleep(1)
+    # Wait for logging to complete and the buffered rows to be flushed
+    time.sleep(DataLogger.FLUSH_INTERVAL + 1)
     
     # Test analyzer
     if stats['current_file']:
@@ -1,6 +1,31 @@
 import re
+import struct
+import time
+from collections import namedtuple
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Union
+
+# Possessive quantifiers (Python 3.11+) stop the matcher from backtracking into fields
+# of partial packets; fall back to the plain pattern on older interpreters
+try:
+    _PACKET_PATTERN = re.compile(rb'START\|[^|]++\|\d++\|\d++\|[\d.-]++\|\d++\|END')
+except re.error:
+    _PACKET_PATTERN = re.compile(rb'START\|[^|]+\|\d+\|\d+\|[\d.-]+\|\d+\|END')
+
+def _checksum(sensor_sum: int, sequence: int, temperature_int: int) -> int:
+    """Compute packet checksum (sum of sensor_id chars + sequence + temperature) mod 256"""
+    return (sensor_sum + sequence + temperature_int) & 0xFF
+
+class Packet(namedtuple('Packet', 'sensor_id sequence timestamp temperature checksum receive_time missing_packets',
+                        defaults=(0,))):
+    """Parsed UART data packet (receive_time is in time.time_ns() nanoseconds)"""
+    
+    __slots__ = ()
+    
+    @property
+    def timestamp_readable(self) -> datetime:
+        """Sensor timestamp converted to a datetime"""
+        return datetime.fromtimestamp(self.timestamp / 1000.0)
 
 class UARTProtocol:
     """Handles UART protocol parsing and validation"""
@@ -14,7 +39,14 @@ class UARTProtocol:
     PACKET_FIELDS = ['start', 'sensor_id', 'sequence', 'timestamp', 'temperature', 'checksum', 'end']
     EXPECTED_FIELD_COUNT = len(PACKET_FIELDS)
     
-    def __init__(self):
+    # Binary frame (little-endian, 32 bytes):
+    # STRT | SENSOR_ID (8, NUL padded) | SEQUENCE (u32) | TIMESTAMP (u64, ms) | TEMPERATURE (f32) | CHECKSUM (u8) | END
+    BINARY_START_MARKER = b"STRT"
+    BINARY_END_MARKER = b"END"
+    BINARY_PACKET = struct.Struct('<4s8sIQfB3s')
+    
+    def __init__(self, binary: bool = False):
+        self.binary = binary
         self.stats = {
             'packets_received': 0,
             'packets_valid': 0,
@@ -23,97 +55,120 @@ class UARTProtocol:
             'format_errors': 0,
             'last_sequence': {}  # Track sequence per sensor
         }
+        self._sensor_sum_cache: Dict[str, int] = {}  # Valid sensor IDs repeat, so cache their char sums
     
-    def parse_packet(self, raw_data: str) -> Optional[Dict[str, Any]]:
+    def parse_packet(self, raw_data: Union[str, bytes]) -> Optional[Packet]:
         """
         Parse incoming UART packet
         
         Args:
-            raw_data: Raw string data from UART
+            raw_data: Raw string data from UART (a binary frame in binary mode)
             
         Returns:
-            Dictionary with parsed data if valid, None if invalid
+            Packet with parsed data if valid, None if invalid
         """
         self.stats['packets_received'] += 1
         
         try:
-            # Clean the data
-            raw_data = raw_data.strip()
-            
-            # Split by field separator
-            fields = raw_data.split(self.FIELD_SEPARATOR)
-            
-            # Validate field count
-            if len(fields) != self.EXPECTED_FIELD_COUNT:
-                self.stats['format_errors'] += 1
-                self.stats['packets_invalid'] += 1
-                return None
+            # Extract fields
+            if self.binary:
+                packet = self._unpack_binary_packet(raw_data)
+            else:
+                packet = self._split_ascii_packet(raw_data)
             
-            # Validate start and end markers
-            if fields[0] != self.START_MARKER or fields[-1] != self.END_MARKER:
+            if packet is None:
                 self.stats['format_errors'] += 1
                 self.stats['packets_invalid'] += 1
                 return None
             
-            # Extract fields
-            packet_data = {
-                'start': fields[0],
-                'sensor_id': fields[1],
-                'sequence': int(fields[2]),
-                'timestamp': int(fields[3]),
-                'temperature': float(fields[4]),
-                'checksum': int(fields[5]),
-                'end': fields[6],
-                'raw_data': raw_data,
-                'receive_time': datetime.now()
-            }
-            
             # Validate checksum
-            if not self._validate_checksum(packet_data):
+            if not self._validate_checksum(packet):
                 self.stats['checksum_errors'] += 1
                 self.stats['packets_invalid'] += 1
                 return None
             
             # Check sequence number
-            self._check_sequence(packet_data)
-            
-            # Convert timestamp to readable format
-            packet_data['timestamp_readable'] = datetime.fromtimestamp(packet_data['timestamp'] / 1000.0)
+            missing_count = self._check_sequence(packet)
+            if missing_count > 0:
+                packet = packet._replace(missing_packets=missing_count)
             
             self.stats['packets_valid'] += 1
-            return packet_data
+            return packet
             
-        except (ValueError, IndexError) as e:
+        except (ValueError, IndexError, TypeError, struct.error) as e:
             self.stats['format_errors'] += 1
             self.stats['packets_invalid'] += 1
             return None
     
-    def _validate_checksum(self, packet_data: Dict) -> bool:
+    def _split_ascii_packet(self, raw_data: str) -> Optional[Packet]:
+        """Split an ASCII packet into its fields, None if the framing is wrong"""
+        # Clean the data
+        raw_data = raw_data.strip()
+        
+        # Split by field separator
+        fields = raw_data.split(self.FIELD_SEPARATOR)
+        
+        # Validate field count
+        if len(fields) != self.EXPECTED_FIELD_COUNT:
+            return None
+        
+        # Validate start and end markers
+        if fields[0] != self.START_MARKER or fields[-1] != self.END_MARKER:
+            return None
+        
+        return Packet(fields[1], int(fields[2]), int(fields[3]), float(fields[4]),
+                      int(fields[5]), time.time_ns())
+    
+    def _unpack_binary_packet(self, raw_data: bytes, offset: int = 0) -> Optional[Packet]:
+        """Unpack a binary frame into its fields, None if the framing is wrong"""
+        start, sensor_id, sequence, timestamp, temperature, checksum, end = \
+            self.BINARY_PACKET.unpack_from(raw_data, offset)
+        
+        # Validate start and end markers
+        if start != self.BINARY_START_MARKER or end != self.BINARY_END_MARKER:
+            return None
+        
+        return Packet(sensor_id.rstrip(b'\0').decode('ascii'), sequence, timestamp, temperature,
+                      checksum, time.time_ns())
+    
+    def _validate_checksum(self, packet: Packet) -> bool:
         """Validate packet checksum"""
         try:
-            # Calculate expected checksum (sum of sensor_id chars + sequence + temperature)
-            sensor_sum = sum(ord(c) for c in packet_data['sensor_id'])
-            expected_checksum = (sensor_sum + packet_data['sequence'] + int(packet_data['temperature'])) % 256
+            sensor_sum = self._sensor_sum(packet.sensor_id)
+            expected_checksum = _checksum(sensor_sum, packet.sequence, int(packet.temperature))
+            
+            if packet.checksum != expected_checksum:
+                return False
             
-            return packet_data['checksum'] == expected_checksum
+            # Only cache IDs from valid packets, so line noise can't grow the cache
+            self._sensor_sum_cache[packet.sensor_id] = sensor_sum
+            return True
         except:
             return False
     
-    def _check_sequence(self, packet_data: Dict):
-        """Check for missing sequence numbers"""
-        sensor_id = packet_data['sensor_id']
-        current_seq = packet_data['sequence']
+    def _sensor_sum(self, sensor_id: str) -> int:
+        """Get sum of sensor_id characters (cached for sensors seen in valid packets)"""
+        sensor_sum = self._sensor_sum_cache.get(sensor_id)
+        if sensor_sum is None:
+            # Summing the encoded bytes is fastest; non-ASCII IDs fall back to summing code points
+            sensor_sum = sum(sensor_id.encode('ascii')) if sensor_id.isascii() else sum(map(ord, sensor_id))
+        return sensor_sum
+    
+    def _check_sequence(self, packet: Packet) -> int:
+        """Check for missing sequence numbers and return how many were skipped"""
+        sensor_id = packet.sensor_id
+        current_seq = packet.sequence
+        missing_count = 0
         
         if sensor_id in self.stats['last_sequence']:
             last_seq = self.stats['last_sequence'][sensor_id]
             if current_seq != last_seq + 1:
-                missing_count = current_seq - last_seq - 1
-                if missing_count > 0:
-                    packet_data['missing_packets'] = missing_count
+                missing_count = max(current_seq - last_seq - 1, 0)
         
         self.stats['last_sequence'][sensor_id] = current_seq
+        return missing_count
     
-    def create_packet(self, sensor_id: str, sequence: int, temperature: float) -> str:
+    def create_packet(self, sensor_id: str, sequence: int, temperature: float) -> Union[str, bytes]:
         """
         Create a UART packet (for testing purposes)
         
@@ -123,13 +178,22 @@ class UARTProtocol:
             temperature: Temperature value
             
         Returns:
-            Formatted packet string
+            Formatted packet string (a binary frame in binary mode)
         """
-        timestamp = int(datetime.now().timestamp() * 1000)
+        timestamp = time.time_ns() // 1_000_000
+        
+        if self.binary:
+            if len(sensor_id) > 8 or not sensor_id.isascii():
+                raise ValueError(f"Binary packets need an ASCII sensor ID of at most 8 characters: '{sensor_id}'")
+            
+            # Checksum must be computed from the temperature as it will be received (float32)
+            temperature = struct.unpack('<f', struct.pack('<f', temperature))[0]
+            checksum = _checksum(self._sensor_sum(sensor_id), sequence, int(temperature))
+            return self.BINARY_PACKET.pack(self.BINARY_START_MARKER, sensor_id.encode('ascii'), sequence,
+                                           timestamp, temperature, checksum, self.BINARY_END_MARKER)
         
         # Calculate checksum
-        sensor_sum = sum(ord(c) for c in sensor_id)
-        checksum = (sensor_sum + sequence + int(temperature)) % 256
+        checksum = _checksum(self._sensor_sum(sensor_id), sequence, int(temperature))
         
         # Build packet
         packet = f"{self.START_MARKER}{self.FIELD_SEPARATOR}"
@@ -168,12 +232,13 @@ class UARTProtocol:
 class UARTBuffer:
     """Handles buffering of incomplete UART data"""
     
-    def __init__(self, max_buffer_size: int = 1024):
-        self.buffer = ""
+    def __init__(self, max_buffer_size: int = 1024, binary: bool = False):
+        self.buffer = bytearray()
         self.max_buffer_size = max_buffer_size
-        self.packet_pattern = re.compile(r'START\|[^|]+\|\d+\|\d+\|[\d.-]+\|\d+\|END')
+        self.binary = binary
+        self.packet_pattern = _PACKET_PATTERN
     
-    def add_data(self, data: str) -> list:
+    def add_data(self, data: Union[str, bytes]) -> list:
         """
         Add new data to buffer and extract complete packets
         
@@ -181,29 +246,64 @@ class UARTBuffer:
             data: New data from UART
             
         Returns:
-            List of complete packets
+            List of complete packets (binary frames in binary mode)
         """
-        self.buffer += data
+        self.buffer.extend(data.encode('ascii', errors='replace') if isinstance(data, str) else data)
+        
+        if self.binary:
+            packets = self._extract_binary_packets()
+        else:
+            # Extract complete packets in a single pass
+            packets = []
+            last_end = 0
+            for match in self.packet_pattern.finditer(self.buffer):
+                # Line noise can put non-ASCII bytes inside a packet; let parsing reject it instead of raising here
+                packets.append(match.group().decode('ascii', errors='replace'))
+                last_end = match.end()
+            
+            # Remove processed packets from buffer
+            if last_end:
+                del self.buffer[:last_end]
         
-        # Prevent buffer overflow
+        # Prevent buffer overflow by keeping only the last half of the unconsumed data
         if len(self.buffer) > self.max_buffer_size:
-            # Keep only the last half of the buffer
-            self.buffer = self.buffer[self.max_buffer_size // 2:]
+            del self.buffer[:len(self.buffer) - self.max_buffer_size // 2]
+        
+        return packets
+    
+    def _extract_binary_packets(self) -> list:
+        """Extract complete binary frames, resynchronising on the start marker"""
+        start_marker = UARTProtocol.BINARY_START_MARKER
+        end_marker = UARTProtocol.BINARY_END_MARKER
+        frame_size = UARTProtocol.BINARY_PACKET.size
         
-        # Extract complete packets
         packets = []
-        matches = self.packet_pattern.findall(self.buffer)
+        pos = 0
+        while True:
+            start = self.buffer.find(start_marker, pos)
+            if start < 0:
+                # Keep bytes that could be the beginning of a start marker
+                pos = max(pos, len(self.buffer) - len(start_marker) + 1)
+                break
+            end = start + frame_size
+            if end > len(self.buffer):
+                # Incomplete frame, wait for more data
+                pos = start
+                break
+            if self.buffer[end - len(end_marker):end] == end_marker:
+                packets.append(bytes(self.buffer[start:end]))
+                pos = end
+            else:
+                pos = start + 1
         
-        for match in matches:
-            packets.append(match)
-            # Remove processed packet from buffer
-            self.buffer = self.buffer.replace(match, '', 1)
+        # Remove processed data from buffer
+        del self.buffer[:pos]
         
         return packets
     
     def clear_buffer(self):
         """Clear the internal buffer"""
-        self.buffer = ""
+        self.buffer.clear()
     
     def get_buffer_size(self) -> int:
         """Get current buffer size"""
@@ -283,7 +383,7 @@ if __name__ == "__main__":
     # Parse the packet
     parsed = protocol.parse_packet(test_packet)
     if parsed:
-        print(f"Parsed successfully: {parsed['sensor_id']}, Temp: {parsed['temperature']}°C")
+        print(f"Parsed successfully: {parsed.sensor_id}, Temp: {parsed.temperature}°C")
     else:
         print("Parsing failed!")
     
@@ -297,6 +397,14 @@ if __name__ == "__main__":
     packets2 = uart_buffer.add_data(partial_data2)
     print(f"Packets from partial data 2: {len(packets2)}")
     
+    # Test binary frame round trip
+    binary_protocol = UARTProtocol(binary=True)
+    binary_buffer = UARTBuffer(binary=True)
+    binary_packet = binary_protocol.create_packet("TEMP01", 126, 25.67)
+    binary_packets = binary_buffer.add_data(binary_packet[:10]) + binary_buffer.add_data(binary_packet[10:])
+    parsed_binary = binary_protocol.parse_packet(binary_packets[0]) if binary_packets else None
+    print(f"Binary packet ({len(binary_packet)} bytes) parsed: {parsed_binary is not None}")
+    
     # Test invalid packet
     invalid_packet = "START|TEMP01|125|1640995200000|27.89|999|END"  # Wrong checksum
     parsed_invalid = protocol.parse_packet(invalid_packet)
@@ -3,6 +3,7 @@ import matplotlib.animation as animation
 from matplotlib.widgets import Button
 import numpy as np
 from collections import deque
+import itertools
 import threading
 import time
 from datetime import datetime, timedelta
@@ -10,24 +11,42 @@ from datetime import datetime, timedelta
 class RealTimeVisualizer:
     """Real-time temperature data visualizer using matplotlib"""
     
+    SENSOR_COLORS = ['blue', 'red', 'green', 'orange', 'purple', 'brown', 'pink', 'gray']
+    
+    # Minimum time (seconds) between statistics text refreshes
+    STATS_UPDATE_PERIOD = 0.5
+    
     def __init__(self, max_points=100, update_interval=1000):
         self.max_points = max_points
         self.update_interval = update_interval
         
-        # Data storage
-        self.timestamps = deque(maxlen=max_points)
-        self.temperatures = deque(maxlen=max_points)
+        # Data storage: mirrored ring buffers (each sample written at i and i + max_points)
+        # so the most recent points are always available as one contiguous slice
+        self._ts = np.empty(2 * max_points, dtype=np.float64)  # epoch seconds
+        self._tp = np.empty(2 * max_points, dtype=np.float64)  # temperatures
+        self._elapsed = np.empty(max_points, dtype=np.float64)  # Reused for the plotted x values
+        self._n = 0
+        self._head = 0
         self.sensor_data = {}  # Store data for multiple sensors
+        self._color_cycle = itertools.cycle(self.SENSOR_COLORS)
         
         # Statistics
         self.stats = {
             'min_temp': float('inf'),
             'max_temp': float('-inf'),
             'avg_temp': 0,
+            'std_temp': 0,
             'data_points': 0,
             'last_update': None
         }
         
+        # Running statistics: Welford mean/variance and sliding-window min/max
+        # kept as monotonic deques of (temperature, sample index) pairs
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._window_min = deque()
+        self._window_max = deque()
+        
         # Threading
         self.data_lock = threading.Lock()
         self.running = False
@@ -43,6 +62,8 @@ class RealTimeVisualizer:
         self.pause_button = None
         self.clear_button = None
         self.stats_text = None
+        self._last_stats_render = float('-inf')
+        self._last_stats_key = None
         
     def setup_plot(self):
         """Initialize the matplotlib plot"""
@@ -87,14 +108,18 @@ class RealTimeVisualizer:
         self.clear_button.on_clicked(self.clear_data)
     
     def add_data_point(self, sensor_id, temperature, timestamp=None):
-        """Add a new data point (thread-safe)"""
+        """Add a new data point (thread-safe); timestamp is a datetime or epoch seconds"""
         with self.data_lock:
             if timestamp is None:
-                timestamp = datetime.now()
+                timestamp = time.time()
             
             # Store data
-            self.timestamps.append(timestamp)
-            self.temperatures.append(temperature)
+            epoch = timestamp.timestamp() if isinstance(timestamp, datetime) else float(timestamp)
+            head = self._head
+            self._ts[head] = self._ts[head + self.max_points] = epoch
+            self._tp[head] = self._tp[head + self.max_points] = temperature
+            self._head = (head + 1) % self.max_points
+            self._n = min(self._n + 1, self.max_points)
             
             # Store sensor-specific data
             if sensor_id not in self.sensor_data:
@@ -110,59 +135,101 @@ class RealTimeVisualizer:
             # Update statistics
             self.update_stats(temperature)
     
+    def _window(self):
+        """Get contiguous views of the stored timestamps and temperatures, oldest first"""
+        start = (self._head - self._n) % self.max_points
+        return self._ts[start:start + self._n], self._tp[start:start + self._n]
+    
     def get_sensor_color(self, sensor_id):
-        """Get color for sensor based on ID"""
-        colors = ['blue', 'red', 'green', 'orange', 'purple', 'brown', 'pink', 'gray']
-        sensor_hash = hash(sensor_id) % len(colors)
-        return colors[sensor_hash]
+        """Get color for sensor, assigning the next unused color to new sensors"""
+        if sensor_id in self.sensor_data:
+            return self.sensor_data[sensor_id]['color']
+        return next(self._color_cycle)
     
     def update_stats(self, temperature):
         """Update statistics"""
         self.stats['data_points'] += 1
         self.stats['min_temp'] = min(self.stats['min_temp'], temperature)
         self.stats['max_temp'] = max(self.stats['max_temp'], temperature)
-        self.stats['last_update'] = datetime.now()
+        self.stats['last_update'] = time.time()
+        
+        # Update running average and standard deviation (Welford)
+        n = self.stats['data_points']
+        delta = temperature - self._mean
+        self._mean += delta / n
+        self._m2 += delta * (temperature - self._mean)
+        self.stats['avg_temp'] = self._mean
+        self.stats['std_temp'] = (self._m2 / (n - 1)) ** 0.5 if n > 1 else 0.0
         
-        # Calculate running average
-        if len(self.temperatures) > 0:
-            self.stats['avg_temp'] = sum(self.temperatures) / len(self.temperatures)
+        # Update sliding-window min/max over the last max_points samples
+        index = n - 1
+        while self._window_min and self._window_min[-1][0] >= temperature:
+            self._window_min.pop()
+        self._window_min.append((temperature, index))
+        while self._window_max and self._window_max[-1][0] <= temperature:
+            self._window_max.pop()
+        self._window_max.append((temperature, index))
+        
+        oldest = index - self.max_points
+        if self._window_min[0][1] <= oldest:
+            self._window_min.popleft()
+        if self._window_max[0][1] <= oldest:
+            self._window_max.popleft()
     
     def animate(self, frame):
         """Animation function called by matplotlib"""
         if self.paused:
-            return self.line,
+            return self.line, self.stats_text
         
         with self.data_lock:
-            if len(self.timestamps) == 0:
-                return self.line,
+            if self._n == 0:
+                return self.line, self.stats_text
             
             # Convert timestamps to seconds for plotting
-            if len(self.timestamps) > 1:
-                time_seconds = [(t - self.timestamps[0]).total_seconds() for t in self.timestamps]
-            else:
-                time_seconds = [0]
+            timestamps, temperatures = self._window()
+            time_seconds = np.subtract(timestamps, timestamps[0], out=self._elapsed[:self._n])
             
-            # Update main line
-            self.line.set_data(time_seconds, list(self.temperatures))
+            # Update main line (Line2D copies its inputs, so passing reused buffers is safe)
+            self.line.set_data(time_seconds, temperatures)
             
-            # Update axis limits
-            if len(time_seconds) > 0:
-                self.ax.set_xlim(min(time_seconds), max(time_seconds) + 1)
+            # Update axis limits only when the data leaves (or shrinks well inside) the current view,
+            # since a limit change forces a full redraw instead of a blit
+            rescale = False
+            xmin, xmax = self.ax.get_xlim()
+            x_needed = time_seconds[-1] + 1
+            if x_needed > xmax or x_needed < xmax * 0.5:
+                self.ax.set_xlim(0, x_needed * 1.2)
+                rescale = True
             
-            if len(self.temperatures) > 0:
-                temp_min = min(self.temperatures)
-                temp_max = max(self.temperatures)
-                temp_range = temp_max - temp_min
-                margin = max(temp_range * 0.1, 1)  # 10% margin or 1°C minimum
+            temp_min = self._window_min[0][0]
+            temp_max = self._window_max[0][0]
+            temp_range = temp_max - temp_min
+            margin = max(temp_range * 0.1, 1)  # 10% margin or 1°C minimum
+            ymin, ymax = self.ax.get_ylim()
+            if temp_min < ymin or temp_max > ymax or temp_range + 2 * margin < (ymax - ymin) * 0.5:
                 self.ax.set_ylim(temp_min - margin, temp_max + margin)
+                rescale = True
             
-            # Update statistics display
+            # Update statistics display (throttled internally)
             self.update_stats_display()
         
-        return self.line,
+        # Redraw synchronously so the animation caches the blit background with the new limits
+        if rescale:
+            self.fig.canvas.draw()
+        
+        return self.line, self.stats_text
     
     def update_stats_display(self):
         """Update the statistics text display"""
+        # Text layout is expensive, so only re-render periodically and when the shown values change
+        now = time.monotonic()
+        stats_key = (self.stats['data_points'], round(self.stats['min_temp'], 1), round(self.stats['max_temp'], 1),
+                     round(self.stats['avg_temp'], 1), round(self.stats['std_temp'], 2), len(self.sensor_data))
+        if now - self._last_stats_render < self.STATS_UPDATE_PERIOD or stats_key == self._last_stats_key:
+            return
+        self._last_stats_render = now
+        self._last_stats_key = stats_key
+        
         if self.stats['data_points'] == 0:
             stats_str = "No data received yet..."
         else:
@@ -171,7 +238,8 @@ Points: {self.stats['data_points']}
 Min: {self.stats['min_temp']:.1f}°C
 Max: {self.stats['max_temp']:.1f}°C
 Avg: {self.stats['avg_temp']:.1f}°C
-Last: {self.stats['last_update'].strftime('%H:%M:%S') if self.stats['last_update'] else 'N/A'}
+Std: {self.stats['std_temp']:.2f}°C
+Last: {time.strftime('%H:%M:%S', time.localtime(self.stats['last_update'])) if self.stats['last_update'] else 'N/A'}
 Sensors: {len(self.sensor_data)}"""
         
         self.stats_text.set_text(stats_str)
@@ -185,18 +253,24 @@ Sensors: {len(self.sensor_data)}"""
     def clear_data(self, event):
         """Clear all data"""
         with self.data_lock:
-            self.timestamps.clear()
-            self.temperatures.clear()
+            self._n = 0
+            self._head = 0
             self.sensor_data.clear()
+            self._color_cycle = itertools.cycle(self.SENSOR_COLORS)
             
             # Reset statistics
             self.stats = {
                 'min_temp': float('inf'),
                 'max_temp': float('-inf'),
                 'avg_temp': 0,
+                'std_temp': 0,
                 'data_points': 0,
                 'last_update': None
             }
+            self._mean = 0.0
+            self._m2 = 0.0
+            self._window_min.clear()
+            self._window_max.clear()
         
         plt.draw()
     
@@ -208,7 +282,7 @@ Sensors: {len(self.sensor_data)}"""
         # Start animation
         self.animation = animation.FuncAnimation(
             self.fig, self.animate, interval=self.update_interval, 
-            blit=False, cache_frame_data=False
+            blit=True, cache_frame_data=False
         )
         
         plt.show()
@@ -237,21 +311,23 @@ Sensors: {len(self.sensor_data)}"""
         """Get summary of current data"""
         with self.data_lock:
             summary = {
-                'total_points': len(self.temperatures),
+                'total_points': self._n,
                 'sensors': list(self.sensor_data.keys()),
                 'time_range': None,
                 'temperature_range': None,
                 'statistics': self.stats.copy()
             }
             
-            if len(self.timestamps) > 1:
-                time_span = self.timestamps[-1] - self.timestamps[0]
+            timestamps, temperatures = self._window()
+            
+            if self._n > 1:
+                time_span = timedelta(seconds=timestamps[-1] - timestamps[0])
                 summary['time_range'] = str(time_span)
             
-            if len(self.temperatures) > 0:
+            if self._n > 0:
                 summary['temperature_range'] = {
-                    'min': min(self.temperatures),
-                    'max': max(self.temperatures)
+                    'min': self._window_min[0][0],
+                    'max': self._window_max[0][0]
                 }
             
             return summary